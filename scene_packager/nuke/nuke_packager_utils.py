@@ -9,10 +9,23 @@ from scene_packager import utils
 
 
 # Global
-NODE_PARSE_REGEX = r"(?P<node>(?P<start>(^(?P<class>.*)\ \{))" \
-    "(?P<knobs>(?:.*\n)+)(?P<end>^(| +)}$))"
 INVALIDS = [r"^add_layer", r"^define_window_layout"]
 
+# Compiled regex
+_INVALIDS_RE = re.compile("|".join(INVALIDS))
+_ROOT_RE = re.compile(r"Root \{\n")
+_PDIR_RE = re.compile(r"(^| +)project_directory.*\n")
+
+# Missing knob sentinel
+_MISSING = object()
+
+# Node classes that write files (outputs)
+OUTPUT_NODE_CLASSES = frozenset(["DeepWrite", "Write"])
+# File knobs per node class (if not the default "file" knob)
+FILE_KNOBS = {
+    "Vectorfield": ("vfield_file",)
+}
+
 
 def get_node_class(data):
     """
@@ -21,39 +34,43 @@ def get_node_class(data):
     Returns:
         Class str
     """
-    match = re.search("^(?P<node_class>.*) {", data)
-    if match:
-        return match.group("node_class")
+    # Class is the text before the last " {" on the first line
+    first_line = data.partition("\n")[0]
+    index = first_line.rfind(" {")
+    if index != -1:
+        return first_line[:index]
 
 
 def get_node_knobs(data):
     """
     Get dict of node knobs from parsed data
     """
-    match = re.search(NODE_PARSE_REGEX, data, re.MULTILINE)
-    if not match:
+    # Class is the text before the last " {" on the first line
+    first_line, _, rest = data.partition("\n")
+    index = first_line.rfind(" {")
+
+    # Knobs end at the last closing bracket line
+    lines = rest.split("\n")
+    end = len(lines) - 1
+    while end >= 0 and "}" != lines[end].lstrip(" "):
+        end -= 1
+
+    if -1 == index or end < 0:
         raise ValueError("Could not parse node data! {0}".format(data))
 
     # Parse knobs
     knobs = {}
-    knob_data = match.group("knobs")
-    # print("*" * 30)
-    # print("knob data", knob_data)
-    for line in knob_data.splitlines():
-        # Skip blank line
-        if not line:
+    for line in [first_line[index + 2:]] + lines[:end]:
+        # Knob lines are "name value"
+        name, sep, value = line.strip(" ").partition(" ")
+        # Skip blank line and multi-line value lines
+        if not value or name[:1] in ("{", "}"):
             continue
 
-        knob_match = re.search("(?P<name>[a-zA-Z0-9_.]+) (?P<value>.+)$",
-                               line.strip(" "))
-        if knob_match:
-            # print("knob", knob_match.group("name"), knob_match.group("value"))
-            knobs[knob_match.group("name")] = knob_match.group("value")
-        # else:
-            # print("no match", line)
+        knobs[name] = value
 
     # Add class
-    knobs["Class"] = match.group("class")
+    knobs["Class"] = first_line[:index]
 
     return knobs
 
@@ -65,7 +82,7 @@ def get_node_subdir(node):
     Returns:
         dir str
     """
-    if node.Class() in ["DeepWrite", "Write"]:
+    if node.Class() in OUTPUT_NODE_CLASSES:
         return "images/outputs"
 
     return "images/inputs"
@@ -78,10 +95,7 @@ def get_node_file_knobs(node_class):
     Returns:
         list of knob name str
     """
-    if node_class in ["Vectorfield"]:
-        return ["vfield_file"]
-
-    return ["file"]
+    return list(FILE_KNOBS.get(node_class, ("file",)))
 
 
 def exclude_node_files(node):
@@ -94,10 +108,7 @@ def exclude_node_files(node):
     Returns:
         bool
     """
-    if node.Class() in ["DeepWrite", "Write"]:
-        return True
-
-    return False
+    return node.Class() in OUTPUT_NODE_CLASSES
 
 
 def _parse_nodes(lines):
@@ -106,15 +117,25 @@ def _parse_nodes(lines):
     """
     unmatched = 0  # Count of unmatched brackets
 
-    node_txt = ""
+    node_lines = []
+    invalid = False
     for line in lines:
+        # No brackets -- bracket count is unchanged
+        if "{" not in line and "}" not in line:
+            if node_lines:
+                node_lines.append(line)
+            continue
+
         # Brackets for active line
-        l_bracket = len([c for c in line if "{" == c])
-        r_bracket = len([c for c in line if "}" == c])
+        l_bracket = line.count("{")
+        r_bracket = line.count("}")
 
-        # No node start -- skip
-        if not node_txt and not l_bracket:
-            continue
+        if not node_lines:
+            # No node start -- skip
+            if not l_bracket:
+                continue
+            # Check for invalid node (patterns only match its first line)
+            invalid = _INVALIDS_RE.match(line) is not None
 
         unmatched += l_bracket
         unmatched -= r_bracket
@@ -123,128 +144,138 @@ def _parse_nodes(lines):
             raise ValueError("Unmatched bracket count went below 0")
 
         # Add line text
-        node_txt += line
+        node_lines.append(line)
 
         # Found complete node
-        if 0 == unmatched and node_txt:
-            new_node = node_txt
-            node_txt = ""
-
-            # Check for invalid node
-            if any([re.search(regex, new_node) for regex in INVALIDS]):
-                continue
-
-            yield new_node
+        if 0 == unmatched:
+            if not invalid:
+                yield "".join(node_lines)
+            node_lines = []
 
 
-def parse_nodes(scene):
+def iter_nodes(scene):
     """
-    Parse nodes from a scene
+    Parse nodes from a scene, one at a time.
+    The script is streamed line by line, so callers can stop early.
 
     Args:
         scene (str): Scene filepath
 
-    Returns:
-        List of ParsedNode objs
+    Yields:
+        ParsedNode objs
     """
     # Validate scene
     scene = utils.clean_path(scene)
     if not os.path.isfile(scene):
-        raise ValueError("Scene does not exist: {0}".format(scene))
+        raise utils.SceneNotFoundError(
+            "Scene does not exist: {0}".format(scene))
     elif ".nk" != os.path.splitext(scene)[-1]:
         raise ValueError("Scene is not a nukescript: {0}".format(scene))
 
-    # Load data
-    data = ""
+    # Parse nodes from script
     with io.open(scene, "r", encoding="utf8") as handle:
-        data = handle.readlines()
+        for node_txt in _parse_nodes(handle):
+            yield ParsedNode(node_txt)
 
-    # Parse nodes from script
-    parsed_nodes = []
-    for node_txt in _parse_nodes(data):
-        parsed_nodes.append(ParsedNode(node_txt))
 
-    return parsed_nodes
+def parse_nodes(scene):
+    """
+    Parse nodes from a scene
+
+    Args:
+        scene (str): Scene filepath
+
+    Returns:
+        List of ParsedNode objs
+    """
+    return list(iter_nodes(scene))
 
 
 def clean_root(root_data, pdir, start, end):
     """
     Clean root node and make sure project directory is set
+
+    Returns:
+        Root node text str
     """
     inserted = root_data
-
-    # Check project directory
-    if "project_directory" in inserted:
-        parsed_root = ParsedNode(root_data)
-        # If project directory setting is empty, remove it
-        if not parsed_root.knob_value("project_directory"):
-            inserted = re.sub("(^| +)project_directory.*\n", "", inserted)
-
-    # Add project directory
-    if "project_directory" not in inserted:
-        pdir_match = re.search("Root \{\n", inserted)
+    # Check settings against the parsed knobs, not the whole text
+    parsed_root = ParsedNode(root_data)
+    knobs = parsed_root.knobs
+    has_pdir = "project_directory" in knobs
+
+    # If project directory setting is empty, remove it
+    if has_pdir and not parsed_root.knob_value("project_directory"):
+        # Cut out the knob line
+        pdir_match = _PDIR_RE.search(inserted)
         if pdir_match:
-            before = inserted[0:pdir_match.end()]
-            after = inserted[pdir_match.end():]
-            try:
-                inserted = r"%s" % before + \
-                    r"%s" % pdir + \
-                    r"%s" % after
-            except AttributeError:
-                inserted = r"%s" % before + r"%s" % pdir + r"%s" % after
-
-    # Root start
-    if "first_frame" not in inserted:
-        first_match = re.search("Root \{\n", inserted)
-        if first_match:
-            first_frame = " first_frame {0}\n".format(start)
-
-            before = inserted[0:first_match.end()]
-            after = inserted[first_match.end():]
-            inserted = r"%s" % before + \
-                r"%s" % first_frame + \
-                r"%s" % after
-
-    # Root end
-    if "last_frame" not in inserted:
-        last_match = re.search("Root \{\n", inserted)
-        if last_match:
-            last_frame = " last_frame {0}\n".format(end)
-            before = inserted[0:last_match.end()]
-            after = inserted[last_match.end():]
-            inserted = r"%s" % before + \
-                r"%s" % last_frame + \
-                r"%s" % after
-
-    return inserted.encode("utf8")
+            inserted = (inserted[:pdir_match.start()] +
+                        inserted[pdir_match.end():])
+        has_pdir = False
+
+    # Add missing settings after the Root start (single splice)
+    # (Inserted as: last_frame, first_frame, project_directory)
+    root_match = _ROOT_RE.search(inserted)
+    if root_match:
+        insertions = []
+        # Root end
+        if "last_frame" not in knobs:
+            insertions.append(" last_frame {0}\n".format(end))
+        # Root start
+        if "first_frame" not in knobs:
+            insertions.append(" first_frame {0}\n".format(start))
+        # Project directory
+        if not has_pdir:
+            insertions.append(pdir)
+
+        if insertions:
+            pos = root_match.end()
+            inserted = "".join(
+                [inserted[:pos]] + insertions + [inserted[pos:]])
+
+    return inserted
 
 
 class ParsedNode(object):
     """
     Helper class for parsed node data from nuke script
     """
+    # One obj per node in the script, skip the per-instance __dict__
+    __slots__ = ("_data", "_knobs", "_class")
+
     def __init__(self, data):
         """
         Initialize node
         """
         self._data = data
-        self.knobs = get_node_knobs(self._data)
+        # Knobs are parsed on first access
+        self._knobs = None
+        # Class from the node's first line (None if it can't be read there)
+        self._class = get_node_class(data)
 
     @property
     def data(self):
         return self._data
 
+    @property
+    def knobs(self):
+        """
+        Dict of node knobs (parsed on first access)
+        """
+        if self._knobs is None:
+            self._knobs = get_node_knobs(self._data)
+
+        return self._knobs
+
     def Class(self):
         """
         Get node class
+        (From the node's first line, without parsing knobs)
         """
-        try:
-            return self.knobs["Class"]
-        except KeyError:
-            if self._data.startswith("Root"):
-                return "Root"
-            else:
-                raise
+        if self._class is None:
+            self._class = self.knobs["Class"]
+
+        return self._class
 
     def knob_value(self, knob_name):
         """
@@ -256,10 +287,10 @@ class ParsedNode(object):
         Returns:
             Str value
         """
-        if knob_name not in self.knobs:
+        value = self.knobs.get(knob_name, _MISSING)
+        if value is _MISSING:
             raise KeyError("No knob called: {0}".format(knob_name))
 
-        value = self.knobs[knob_name]
         # Clean empty str settings
         if value in ["''", '""']:
             return ""
@@ -272,9 +303,7 @@ class ParsedNode(object):
         """
         files = []
         for knob in get_node_file_knobs(self.Class()):
-            try:
+            if knob in self.knobs:
                 files.append(self.knob_value(knob))
-            except KeyError:
-                pass
 
         return files
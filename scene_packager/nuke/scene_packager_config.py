@@ -37,23 +37,28 @@ def get_scene_frange(scene):
     end = None
 
     # Check root nodes
-    nodes = utils.parse_nodes(scene)
-    roots = [n for n in nodes if "Root" == n.Class()]
-    # (There shouldn't really be more than 1 Root...)
-    if len(roots) > 1:
-        log.warning(
-            "Multiple Roots. Using first available frange settings."
-        )
-    # Get start/end from first available root
-    for root in roots:
+    # Get start/end from first available root (stop parsing once found)
+    nodes = []
+    roots = []
+    for node in utils.iter_nodes(scene):
+        if "Root" != node.Class():
+            nodes.append(node)
+            continue
+
+        roots.append(node)
+        # (There shouldn't really be more than 1 Root...)
+        if len(roots) > 1:
+            log.warning(
+                "Multiple Roots. Using first available frange settings."
+            )
         try:
-            start = int(root.knob_value("first_frame"))
-            end = int(root.knob_value("last_frame"))
+            start = int(node.knob_value("first_frame"))
+            end = int(node.knob_value("last_frame"))
         except KeyError:
             log.debug(
                 "Failed to get Root first_frame/last_frame", exc_info=True
             )
-            log.debug(root.data)
+            log.debug(node.data)
         else:
             log.info("Using Root first_frame/last_frame")
             return start, end
@@ -65,12 +70,12 @@ def get_scene_frange(scene):
 
     # No root start/end. Let's try to figure it out from the node settings.
     # Use lowest start frame and highest end frame overall.
-    for node in [n for n in nodes if n not in roots]:
+    for node in nodes:
         # Start
         try:
             node_start = int(node.knob_value("first"))
         except Exception:
-            log.debug("No {}.first".format(node.knob_value("name")))
+            log.debug("No %s.first", node.knob_value("name"))
         else:
             if start is None or node_start < start:
                 start = node_start
@@ -79,17 +84,17 @@ def get_scene_frange(scene):
         try:
             node_end = int(node.knob_value("last"))
         except Exception:
-            log.debug("No {}.last".format(node.knob_value("name")))
+            log.debug("No %s.last", node.knob_value("name"))
         else:
             if end is None or node_end > end:
                 end = node_end
 
     # Found start/end
     if start is not None and end is not None:
-        log.info("Start: {} | End: {}".format(start, end))
+        log.info("Start: %s | End: %s", start, end)
         return start, end
 
-    log.error("{} root nodes".format(len(roots)))
+    log.error("%s root nodes", len(roots))
     for root in roots:
         log.error(root.data)
     raise RuntimeError("Could not figure out scene start/end. [Check whether "
@@ -119,85 +124,73 @@ def load_scene_data(packaged_scene, package_root, source_scene):
     start = None
     end = None
 
-    for node in utils.parse_nodes(source_scene):
+    # Config lookup is constant for the whole scene
+    use_relative_paths = \
+        scene_packager.scene_packager_config.use_relative_paths()
+    # Package subdir per node class
+    node_subdirs = {}
+
+    for node in utils.iter_nodes(source_scene):
         # Found root
         if "Root" == node.Class():
             root = node
 
         # Process node files
-        if (not utils.exclude_node_files(node)) and node.files():
-            for file in node.files():
+        files = [] if utils.exclude_node_files(node) else node.files()
+        if files:
+            # Package dir for this node's files
+            node_class = node.Class()
+            if node_class not in node_subdirs:
+                node_subdirs[node_class] = utils.get_node_subdir(node)
+            node_dir = os.path.join(package_root,
+                                    node_subdirs[node_class],
+                                    node.knob_value("name"))
+            # Node frame range
+            node_start = None
+            node_end = None
+            if "first" in node.knobs:
+                node_start = int(node.knob_value("first"))
+            if "last" in node.knobs:
+                node_end = int(node.knob_value("last"))
+
+            for file in files:
                 # Get target file path
                 dst = scene_packager.scene_packager_config.get_packaged_path(
-                    file,
-                    os.path.join(package_root,
-                                 utils.get_node_subdir(node),
-                                 node.knob_value("name"))
+                    file, node_dir
                 )
                 rel = ""
-                if scene_packager.scene_packager_config.use_relative_paths():
+                if use_relative_paths:
                     try:
                         rel = scene_packager.utils.get_relative_path(
                             packaged_scene, dst, package_root
                         )
                     except AssertionError:
-                        log.error(
-                            "Error getting relative path: {}".format(
-                                node.knob_value("name")
-                            )
-                        )
-                        log.error("packaged root: {}".format(package_root))
-                        log.error("packaged scene: {}".format(packaged_scene))
-                        log.error("dependency: {}".format(dst))
+                        log.error("Error getting relative path: %s",
+                                  node.knob_value("name"))
+                        log.error("packaged root: %s", package_root)
+                        log.error("packaged scene: %s", packaged_scene)
+                        log.error("dependency: %s", dst)
                         raise
 
-                # Node already logged
-                curr_start = None
-                curr_end = None
-                if file in dep_data:
-                    curr_start = dep_data[file].get("start")
-                    curr_end = dep_data[file].get("end")
-                    # Start frame
-                    try:
-                        start = node.knob_value("first")
-                    except KeyError:
-                        pass
-                    else:
-                        if curr_start is None or int(start) < int(curr_start):
-                            dep_data[file]["start"] = int(start)
-                    # End frame
-                    try:
-                        end = node.knob_value("last")
-                    except KeyError:
-                        pass
-                    else:
-                        if curr_end is None or int(end) > int(curr_end):
-                            dep_data[file]["end"] = int(end)
-                # New node
-                else:
-                    data = {
-                        "packaged_path": dst,
-                        "relative_path": rel
-                    }
-
-                    # Start frame
-                    try:
-                        data["start"] = int(node.knob_value("first"))
-                    except KeyError:
-                        pass
-                    else:
-                        if start is None or data["start"] < start:
-                            start = data["start"]
-                    # End frame
-                    try:
-                        data["end"] = int(node.knob_value("last"))
-                    except KeyError:
-                        pass
-                    else:
-                        if end is None or data["end"] > end:
-                            end = data["end"]
-
-                    dep_data[file] = data
+                # Add file (first node to use it sets the packaged path)
+                data = dep_data.setdefault(
+                    file, {"packaged_path": dst, "relative_path": rel}
+                )
+                # Use lowest start frame and highest end frame per file
+                if node_start is not None:
+                    if data.get("start") is None or node_start < data["start"]:
+                        data["start"] = node_start
+                if node_end is not None:
+                    if data.get("end") is None or node_end > data["end"]:
+                        data["end"] = node_end
+
+            # Scene start/end (lowest and highest overall)
+            if node_start is not None:
+                if start is None or node_start < start:
+                    start = node_start
+            if node_end is not None:
+                if end is None or node_end > end:
+                    end = node_end
 
     # Raise error if no root found
     if root is None:
@@ -218,7 +211,7 @@ def write_packaged_scene(source_scene, dst_scene, dep_data, root,
     import nuke_packager_utils as utils
 
     log = scene_packager.utils.get_logger(__name__)
-    log.info("relative paths={}".format(relative_paths))
+    log.info("relative paths=%s", relative_paths)
 
     # Load backup scene text
     with io.open(source_scene, "r", encoding="utf8") as handle:
@@ -232,17 +225,13 @@ def write_packaged_scene(source_scene, dst_scene, dep_data, root,
         end
     )
     if new_root:
-        raw_scene_data = re.sub(
-            re.escape(root.data),
-            new_root.decode("utf8"),
-            raw_scene_data,
-            flags=re.UNICODE
-        )
+        raw_scene_data = raw_scene_data.replace(root.data, new_root)
 
     if "project_directory" not in raw_scene_data:
         log.error("project_directory not found in output scene data.")
 
     # Sub new files
+    replacements = {}
     for file, data in dep_data.items():
         if relative_paths:
             if not data.get("relative_path"):
@@ -254,16 +243,23 @@ def write_packaged_scene(source_scene, dst_scene, dep_data, root,
         else:
             dst_file = data["packaged_path"]
 
-        log.debug("Replacing: {} {}".format(file, dst_file))
-        raw_scene_data = re.sub(file,
-                                dst_file,
-                                raw_scene_data,
-                                flags=re.UNICODE)
+        log.debug("Replacing: %s %s", file, dst_file)
+        if file:
+            replacements[file] = dst_file
+
+    # Replace all files in a single pass (longest path first)
+    if replacements:
+        files_regex = re.compile(
+            "|".join(re.escape(file) for file in
+                     sorted(replacements, key=len, reverse=True)),
+            flags=re.UNICODE
+        )
+        raw_scene_data = files_regex.sub(
+            lambda match: replacements[match.group(0)], raw_scene_data
+        )
 
     # Write
     scene_packager.utils.make_dirs(os.path.dirname(dst_scene))
-    with io.open(dst_scene, "w", encoding="utf8") as handle:
-        if isinstance(raw_scene_data, bytes):
-            handle.write(raw_scene_data.decode("utf8"))
-        else:
-            handle.write(raw_scene_data)
+    # (Encode once, single buffered binary write)
+    with io.open(dst_scene, "wb", buffering=1024 * 1024) as handle:
+        handle.write(raw_scene_data.encode("utf8"))
@@ -1,9 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
 import os
-import pprint
-import traceback
-import webbrowser
 
 from . import packagers, scene_packager_config, utils
 
@@ -12,6 +9,8 @@ LOG = utils.get_logger("scene_packager.api")
 
 # Config python file name
 SP_CONFIG_NAME = "scene_packager_config.py"
+# (mtime, size, compiled code) for override configs, by path
+_CONFIG_CODE_CACHE = {}
 
 
 def _get_config_paths(search_path=None, print_info=False):
@@ -47,6 +46,31 @@ def _get_config_paths(search_path=None, print_info=False):
     return paths[::-1]
 
 
+def _get_config_code(path):
+    """
+    Get compiled code for an override config .py file
+    Recompiled only if the file has changed since it was last loaded.
+
+    Args:
+        path (str): Config filepath
+
+    Returns:
+        Code obj
+    """
+    st = os.stat(path)
+    stamp = (getattr(st, "st_mtime_ns", st.st_mtime), st.st_size)
+    cached = _CONFIG_CODE_CACHE.get(path)
+    if cached is not None and cached[:2] == stamp:
+        return cached[2]
+
+    with open(path) as f:
+        code = compile(f.read(), f.name, "exec")
+
+    # One entry per config file, edits replace it
+    _CONFIG_CODE_CACHE[path] = stamp + (code,)
+    return code
+
+
 def _load_config_overrides(search_path=None, print_info=False):
     """
     Load override methods from config .py files
@@ -62,20 +86,23 @@ def _load_config_overrides(search_path=None, print_info=False):
     else:
         log = utils.get_logger("scene_packager.api")
 
-    log.info("*" * 50)
+    log.info(utils.BANNER)
     log.info("Base config: {}".format(
         utils.clean_path(scene_packager_config.__file__))
     )
     log.newline()
 
     paths = _get_config_paths(search_path, print_info=print_info)
+    # Config members that can be overridden
+    config_keys = set(key for key in vars(scene_packager_config)
+                      if not key.startswith("__"))
 
     # Override general config
     index = 0
     for each in paths:
         index += 1
         log.newline()
-        log.info("*" * 50)
+        log.info(utils.BANNER)
         log.info("Processing override # {}".format(index))
         log.newline()
 
@@ -84,9 +111,8 @@ def _load_config_overrides(search_path=None, print_info=False):
         }
 
         try:
-            with open(each) as f:
-                exec(compile(f.read(), f.name, "exec"), mod)
-        except IOError:
+            exec(_get_config_code(each), mod)
+        except (IOError, OSError):
             raise
         except Exception:
             raise ("Invalid override config: {}".format(each))
@@ -94,22 +120,13 @@ def _load_config_overrides(search_path=None, print_info=False):
             log.info("Loading config: {}".format(utils.clean_path(each)))
             log.newline()
 
-        for key in dir(scene_packager_config):
-            if key.startswith("__"):
-                continue
-
-            try:
-                value = mod[key]
-            except KeyError:
-                continue
-            else:
-                log.info("Override: {}".format(key))
-
-            setattr(scene_packager_config, key, value)
+        for key in sorted(config_keys.intersection(mod)):
+            log.info("Override: {}".format(key))
+            setattr(scene_packager_config, key, mod[key])
 
     if paths:
         log.newline()
-        log.info("*" * 50)
+        log.info(utils.BANNER)
 
     return paths
 
@@ -121,12 +138,12 @@ def _init_backup_config():
 
     Returns: None
     """
-    for member in dir(scene_packager_config):
+    # (Snapshot, backups are added to the module while looping)
+    for member, value in list(vars(scene_packager_config).items()):
         if member.startswith("__"):
             continue
 
-        setattr(scene_packager_config, "_%s" % member,
-                getattr(scene_packager_config, member))
+        setattr(scene_packager_config, "_%s" % member, value)
 
 
 def load_config(search_path=None, print_info=False):
@@ -160,7 +177,8 @@ def package_scene(scene, package_root=None, extra_files=None, overwrite=False,
     Package the given scene path
     """
     if not os.path.isfile(scene):
-        raise ValueError("Scene does not exist! {0}".format(scene))
+        raise utils.SceneNotFoundError(
+            "Scene does not exist! {0}".format(scene))
 
     packager = get_scene_packager(scene,
                                   package_root=package_root,
@@ -190,13 +208,12 @@ def package_scenes(scenes, package_root=None, extra_files=None, overwrite=False,
                               mode=mode,
                               verbose=verbose)
             )
-        except ValueError as e:
-            tb_message = "".join(traceback.format_exception(type(e), e, None))
-            if tb_message.startswith("Scene does not exist"):
-                dne.append(scene)
-            else:
-                LOG.error(tb_message, exc_info=True)
-                raise e
+        except utils.SceneNotFoundError:
+            dne.append(scene)
+        except ValueError:
+            LOG.error("Failed to package scene: {0}".format(scene),
+                      exc_info=True)
+            raise
 
     if dne:
         msg = "\n".join(sorted(dne))
@@ -220,18 +237,17 @@ def inspect(root_dir, open_root_dir=False, open_scene_dir=False, verbose=0):
     """
     log = utils.get_logger(__name__, logging.INFO)
 
-    existing = utils.find_existing_packages(root_dir, "package_metadata.json")
+    # Load package metadata while searching
+    existing = utils.load_json_files(
+        utils.iter_existing_packages(root_dir, "package_metadata.json"))
     log.info("Searching root dir... [{}]".format(root_dir))
     log.info("Found {} packages".format(len(existing)))
 
     to_open = []  # Dirs to open
-    for metadata_file in existing:
-        # Load data
-        data = utils.load_json(metadata_file)
-
+    for data in existing:
         # Basic print
         log.newline()
-        log.info("*" * 50)
+        log.info(utils.BANNER)
         log.info("{:15} {}".format(
             "Package root:", data.get("package_settings", {}).get(
                 "package_root"))
@@ -246,6 +262,7 @@ def inspect(root_dir, open_root_dir=False, open_scene_dir=False, verbose=0):
             log.info("{:15} {}".format("Date:", data.get("date")))
         # -vv
         if verbose >= 2:
+            import pprint
             log.info("Package metadata: ")
             log.info("\n" + pprint.pformat(data))
 
@@ -260,8 +277,10 @@ def inspect(root_dir, open_root_dir=False, open_scene_dir=False, verbose=0):
                 to_open.append(os.path.dirname(scene))
 
     # Open dirs
-    for subdir in to_open:
-        webbrowser.open(subdir)
+    if to_open:
+        import webbrowser
+        for subdir in to_open:
+            webbrowser.open(subdir)
 
 
 def inspect_config(search_path=None):
@@ -298,41 +317,39 @@ def create_run_command(**kwargs):
         raise ValueError("nocopy and dryrun modes cannot be used together")
 
     # Assemble command
-    cmd = "scene-packager run --scene {}".format(kwargs["scene"])
+    cmd = ["scene-packager", "run", "--scene", kwargs["scene"]]
 
     # Input args
     if "search_path" in kwargs:
-        cmd += " --search-path {}".format(kwargs["search_path"])
+        cmd.extend(["--search-path", kwargs["search_path"]])
 
     if "package_root" in kwargs:
-        cmd += " --package-root {}".format(kwargs["package_root"])
+        cmd.extend(["--package-root", kwargs["package_root"]])
 
     if "extra_files" in kwargs:
-        ex = kwargs["extra_files"]
+        cmd.append("--extra-files")
         if isinstance(kwargs["extra_files"], list):
-            ex = " ".join(kwargs["extra_files"])
-        cmd += " --extra-files {}".format(ex)
+            cmd.extend(kwargs["extra_files"])
+        else:
+            cmd.append(kwargs["extra_files"])
 
     # Boolean flags
     if kwargs.get("overwrite", False):
-        cmd += " --overwrite"
+        cmd.append("--overwrite")
 
     if kwargs.get("nocopy", False):
-        cmd += " --nocopy"
+        cmd.append("--nocopy")
 
     if kwargs.get("dryrun", False):
-        cmd += " --dryrun"
+        cmd.append("--dryrun")
 
     if kwargs.get("ui", False):
-        cmd += " --ui"
+        cmd.append("--ui")
 
-    verbose_arg = ""
-    for v in range(kwargs.get("verbose", 0)):
-        verbose_arg += "v"
-
-    if verbose_arg:
-        cmd += " -{}".format(verbose_arg)
+    if kwargs.get("verbose", 0) > 0:
+        cmd.append("-" + "v" * kwargs["verbose"])
 
+    cmd = " ".join(cmd)
     LOG.info("Created command: {}".format(cmd))
     return cmd
 
@@ -353,32 +370,29 @@ def create_inspect_command(**kwargs):
     Returns:
         cmd str
     """
-    cmd = "scene-packager inspect"
+    cmd = ["scene-packager", "inspect"]
 
     # Input args
     if "search_path" in kwargs:
-        cmd += " --search-path {}".format(kwargs["search_path"])
+        cmd.extend(["--search-path", kwargs["search_path"]])
 
     # Input args
     if "dir" in kwargs:
-        cmd += " --dir {}".format(kwargs["dir"])
+        cmd.extend(["--dir", kwargs["dir"]])
 
     # Boolean args
     if kwargs.get("config", False):
-        cmd += " --config"
+        cmd.append("--config")
 
     if kwargs.get("open_root_dir", False):
-        cmd += " --open-root-dir"
+        cmd.append("--open-root-dir")
 
     if kwargs.get("open_scene_dir", False):
-        cmd += " --open-scene-dir"
-
-    verbose_arg = ""
-    for v in range(kwargs.get("verbose", 0)):
-        verbose_arg += "v"
+        cmd.append("--open-scene-dir")
 
-    if verbose_arg:
-        cmd += " -{}".format(verbose_arg)
+    if kwargs.get("verbose", 0) > 0:
+        cmd.append("-" + "v" * kwargs["verbose"])
 
+    cmd = " ".join(cmd)
     LOG.info("Created command: {}".format(cmd))
     return cmd
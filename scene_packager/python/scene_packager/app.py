@@ -2,14 +2,15 @@
 # Standard
 import sys
 
-# Third party
-from Qt import QtWidgets
-
 
 def main():
     """
     Standalone QApplication app launch
     """
+    # Third party
+    # (Imported here, so importing the package doesn't load Qt)
+    from Qt import QtWidgets
+
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
 
     win = ui.show(parent=None)
@@ -5,7 +5,6 @@ Script for basic file copy operations
 import argparse
 import errno
 import glob
-import json
 import logging
 import os
 import re
@@ -15,6 +14,11 @@ import subprocess
 from . import utils
 
 
+# Frame number at the end of a file base name
+FRAME_REGEX = r"(?<=[_\.])(?P<frame>#+|\d+|\%\d*d)$"
+_FRAME_RE = re.compile(FRAME_REGEX)
+
+
 def parse_args():
     """
     Parse input args
@@ -86,6 +90,44 @@ def clean_path(path):
     return path
 
 
+def get_copy_pairs(src, dst, globbed):
+    """
+    Get source and destination file pairs for a copy entry
+
+    Args:
+        src (str): Source file path (may be a glob pattern)
+        dst (str): Destination file path (may be a glob pattern)
+        globbed (list): Source files matching src
+
+    Returns:
+        List of (source file path, destination file path) tuples,
+        or None if a source frame could not be found for a renamed copy
+    """
+    dst_dir = os.path.dirname(dst)
+    # Same file names
+    if os.path.basename(src) == os.path.basename(dst):
+        return [(each, utils.join_path(dst_dir, os.path.basename(each)))
+                for each in globbed]
+
+    # Renamed single file
+    frame_base, ext = os.path.splitext(os.path.basename(dst))
+    if "*" not in frame_base:
+        if 1 != len(globbed):
+            return None
+        return [(globbed[0], dst)]
+
+    # Renamed sequence, sub each source frame into the dest name
+    pairs = []
+    for each in globbed:
+        match = _FRAME_RE.search(os.path.splitext(each)[0])
+        if not match:
+            return None
+        pairs.append((each, utils.join_path(
+            dst_dir, frame_base.replace("*", match.group("frame")) + ext)))
+
+    return pairs
+
+
 def copy_files(data, force=False, log_level=logging.WARNING):
     """
     Copy files
@@ -102,7 +144,7 @@ def copy_files(data, force=False, log_level=logging.WARNING):
 
     # Copy each
     failed = []
-    FRAME_REGEX = r"(?<=[_\.])(?P<frame>#+|\d+|\%\d*d)$"
+    made_dirs = set()  # Dest dirs already created
     for src, data in data.items():
         # Clean inputs
         src = clean_path(src)
@@ -118,12 +160,9 @@ def copy_files(data, force=False, log_level=logging.WARNING):
         globbed = glob.glob(src)
         # Create parent dirs
         if globbed:
-            try:
-                os.makedirs(dst_dir)
-            except OSError as e:
-                # Ok to continue if parent directory already exists
-                if e.errno != errno.EEXIST:
-                    raise
+            if dst_dir not in made_dirs:
+                utils.make_dirs(dst_dir)
+                made_dirs.add(dst_dir)
 
             # Copy
             if "nt" == os.name:
@@ -172,11 +211,15 @@ def copy_files(data, force=False, log_level=logging.WARNING):
                         failed.append("Error creating single frame copy "
                                       "commands: {0}".format(src))
                         continue
+            # Posix, copy in this process
             else:
-                # TODO Linux
-                # cmd = "cp {0} {1}"
-                failed.append("Posix not implemented: {0}".format(src))
-                continue
+                cmd = None
+                to_rename = {}
+                pairs = get_copy_pairs(src, dst, globbed)
+                if pairs is None:
+                    failed.append("Error getting file copy paths: "
+                                  "{0}".format(src))
+                    continue
 
             # Logging
             log.newline()
@@ -184,22 +227,31 @@ def copy_files(data, force=False, log_level=logging.WARNING):
                 log.info("Copying {0} files...".format(len(globbed)))
             else:
                 log.info("Copying {0} file...".format(len(globbed)))
-            log.info(cmd)
 
             # Run copy
-            proc = subprocess.Popen(cmd,
-                                    stdout=subprocess.PIPE,
-                                    stderr=subprocess.PIPE,
-                                    shell=True,
-                                    cwd=cwd)
+            if cmd is None:
+                try:
+                    utils.copy_files(pairs, overwrite=force,
+                                     verbose=log_level <= logging.DEBUG)
+                except (IOError, OSError) as e:
+                    failed.append("Failed to copy files: {0}\n{1}".format(
+                        src, e))
+                    continue
+            else:
+                log.info(cmd)
+                proc = subprocess.Popen(cmd,
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE,
+                                        shell=True,
+                                        cwd=cwd)
 
-            stdout, stderr = proc.communicate()
+                stdout, stderr = proc.communicate()
 
-            # Logging
-            log.debug(stdout)
-            if stderr:
-                log.error(stderr)
-            log.debug("Return code: {}".format(proc.returncode))
+                # Logging
+                log.debug(stdout)
+                if stderr:
+                    log.error(stderr)
+                log.debug("Return code: {}".format(proc.returncode))
 
             # Rename
             if to_rename:
@@ -248,7 +300,7 @@ def copy_files(data, force=False, log_level=logging.WARNING):
 
     if failed:
         log.newline()
-        log.error("-" * 50)
+        log.error(utils.DIVIDER)
         log.error("Copy errors:")
         log.error("\n".join(failed))
         raise RuntimeError("{0} errors copying files".format(len(failed)))
@@ -277,8 +329,7 @@ def main():
     force = args.force
 
     # Load files
-    with open(metadata, mode="rb") as handle:
-        data = json.load(handle)
+    data = utils.load_json(metadata)
 
     # Verbosity
     if args.verbose > 1:
@@ -287,6 +338,8 @@ def main():
         log_level = logging.INFO
     else:
         log_level = logging.WARNING
+    # utils logs the copied files (Eg: utils.copy_files verbose output)
+    utils.set_log_level(log_level)
 
     # Run
     copy_files(data, force=force, log_level=log_level)
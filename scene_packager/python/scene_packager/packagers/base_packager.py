@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 # Standard
 import io
+import json
 import logging
+import operator
 import os
 import pprint
+import stat
+import sys
 
 # Scene packager
 from scene_packager import batch_copy, scene_packager_config, utils
@@ -18,10 +22,26 @@ class Packager(object):
     Args:
         scene (str): Scene filepath
     """
-    def __init__(self, scene, package_root=None, extra_files=None, verbose=0):
+    # Packager mode descriptions
+    _MODE_STR = {
+        0: "normal",
+        1: "nocopy"
+    }
+    # Settings holding file/dir paths (normalized once in _init_settings)
+    _PATH_SETTINGS = (
+        "package_root",
+        "packaged_scene",
+        "source_scene_copy",
+        "metadata_path",
+        "filecopy_metadata_path"
+    )
+
+    # Scene data cache file basename prefix
+    _SCENE_DATA_CACHE_PREFIX = "scene_data_"
+    # Max scene data cache files kept (least recently used are pruned)
+    _SCENE_DATA_CACHE_SIZE = 50
 
-        if not os.path.exists(scene):
-            raise ValueError("Scene does not exist!")
+    def __init__(self, scene, package_root=None, extra_files=None, verbose=0):
 
         # Log
         self.log = utils.get_logger(__name__, verbose)
@@ -40,6 +60,8 @@ class Packager(object):
         self.mode = 0
 
         self.scene = None
+        # Scene os.stat result (stat once, reused for cache lookups)
+        self._scene_stat = None
         self.extra_files = []
 
         # Scene attrs
@@ -48,15 +70,15 @@ class Packager(object):
         self.scene_end = None
         self.scene_root = None
 
-        # File copy src/dst metadata
-        self.filecopy_metadata = {}
+        # File copy src/dst metadata (None until built for loaded scene)
+        self.filecopy_metadata = None
         self.extracopy_metadata = {}
 
         # File dependency data dict
         self.dep_data = {}
 
-        # Scene file text backup
-        self._scene_txt = ""
+        # Scene file text backup (loaded on first access)
+        self._scene_txt = None
         # TODO - Nuke specific
         # Skip node classes when copying files
         self.exclude_node_files = []
@@ -78,8 +100,10 @@ class Packager(object):
 
         # Defaults
         # Override of root (since it's used by others below)
-        self.settings["package_root"] = settings.get("package_root") or \
+        self.settings["package_root"] = utils.clean_path(
+            settings.get("package_root") or
             scene_packager_config.package_root(self.scene)
+        )
 
         self.settings["packaged_scene"] = \
             scene_packager_config.packaged_scene_path(self.scene,
@@ -107,19 +131,29 @@ class Packager(object):
                                                     self.package_root,
                                                     self.scene)
 
-        start, end = scene_packager_config.get_scene_frange(self.scene)
+        # Only parse the scene frange if it's not provided
+        if settings.get("start") is not None and \
+                settings.get("end") is not None:
+            start, end = settings["start"], settings["end"]
+        else:
+            start, end = scene_packager_config.get_scene_frange(self.scene)
         self.settings["start"] = start
         self.settings["end"] = end
         self.scene_start = start
         self.scene_end = end
 
         # Overrides
-        for key, val in settings.items():
-            if val is not None:
-                self.log.debug(
-                    "Input setting: {}={}".format(key, val)
-                )
-                self.settings[key] = val
+        overrides = {key: val for key, val in settings.items()
+                     if val is not None}
+        if self.log.isEnabledFor(logging.DEBUG):
+            for key, val in overrides.items():
+                self.log.debug("Input setting: %s=%s", key, val)
+        self.settings.update(overrides)
+
+        # Normalize paths once, so hooks and helpers get clean paths
+        for key in self._PATH_SETTINGS:
+            if self.settings.get(key):
+                self.settings[key] = utils.clean_path(self.settings[key])
 
         return self.settings
 
@@ -128,14 +162,24 @@ class Packager(object):
         Set scene file for package
         """
         scene = utils.clean_path(scene)
-        if not os.path.isfile(scene):
-            raise ValueError("Scene does not exist: {0}")
+        try:
+            scene_stat = os.stat(scene)
+        except OSError:
+            scene_stat = None
+        if scene_stat is None or not stat.S_ISREG(scene_stat.st_mode):
+            raise utils.SceneNotFoundError(
+                "Scene does not exist: {0}".format(scene))
 
         # Clear node data
         self.dep_data = {}
+        self.filecopy_metadata = None
+
+        # New run date/user for this scene's package
+        utils.reset_run_context()
 
         # Update scene
         self.scene = scene
+        self._scene_stat = scene_stat
 
         # Initialize package settings
         settings = {}
@@ -148,9 +192,8 @@ class Packager(object):
         if extra_files is not None:
             self.extra_files = extra_files
 
-        # Load file text
-        with io.open(self.scene, "r", encoding="utf8") as handle:
-            self._scene_txt = handle.read()
+        # Scene file text is loaded on demand
+        self._scene_txt = None
 
     def set_mode(self, mode):
         """
@@ -170,47 +213,50 @@ class Packager(object):
 
         Returns: None
         """
-        if not isinstance(mode, int):
+        try:
+            self.mode = operator.index(mode)
+        except TypeError:
             raise TypeError("Invalid mode type: '{}'. Must be int".format(
                 type(mode))
             )
 
-        self.mode = mode
-
-        if 0 == self.mode:
-            self.log.debug("Package mode==0 ({} mode)".format(self.mode_str))
-        elif 1 == self.mode:
-            self.log.debug("Package mode==1 ({} mode)".format(self.mode_str))
-        elif 2 <= self.mode:
-            self.log.debug("Package mode<=2 ({} mode)".format(self.mode_str))
+        self.log.debug("Package mode==%s (%s mode)", self.mode, self.mode_str)
 
     @property
     def mode_str(self):
         """
         Get description str of packager mode
         """
-        if 0 == self.mode:
-            return "normal"
-        elif 1 == self.mode:
-            return "nocopy"
-        elif 2 <= self.mode:
-            return "debug"
-        else:
+        if self.mode < 0:
             raise ValueError("Invalid mode: {}".format(self.mode))
 
+        # Level 2+ is dryrun
+        return self._MODE_STR.get(self.mode, "debug")
+
     def set_verbosity(self, verbose=0):
         """
         Set logging level
         """
         if 0 == verbose:
             self.log.setLevel(logging.WARNING)
-            utils.SCENE_PACKAGER_LOG_LEVEL = logging.WARNING
+            utils.set_log_level(logging.WARNING)
         elif 1 == verbose:
             self.log.setLevel(logging.INFO)
-            utils.SCENE_PACKAGER_LOG_LEVEL = logging.INFO
+            utils.set_log_level(logging.INFO)
         elif 2 <= verbose:
             self.log.setLevel(logging.DEBUG)
-            utils.SCENE_PACKAGER_LOG_LEVEL = logging.DEBUG
+            utils.set_log_level(logging.DEBUG)
+
+    @property
+    def scene_text(self):
+        """
+        Scene file text (read once, on first access)
+        """
+        if self._scene_txt is None:
+            with io.open(self.scene, "r", encoding="utf8") as handle:
+                self._scene_txt = handle.read()
+
+        return self._scene_txt
 
     @property
     def package_root(self):
@@ -278,58 +324,75 @@ class Packager(object):
         """
         Get file copy metadata dict
 
+        Each source glob maps to its packaged glob and frame range:
+            {"dst": <packaged glob>, "frame_range": [start, end]}
+        frame_range is empty if the copy is not frame limited.
+
         Returns:
             Dict
         """
         # Return Existing
-        if reload is False and self.filecopy_metadata:
+        if reload is False and self.filecopy_metadata is not None:
             return self.filecopy_metadata
 
         # Load fresh
         to_copy = {}
+        dep_items = self.dep_data.items()
 
         # TODO Logging
         # print(self.dep_data)
 
-        if self.log.level == logging.DEBUG:
+        # Debug spacing (checked once, not per dependency)
+        debug = self.log.level == logging.DEBUG
+
+        if debug:
             self.log.newline()
         self.log.debug("Finding scene file dependencies...")
 
-        for src_path, data in self.dep_data.items():
-            if self.log.level == logging.DEBUG:
+        for src_path, data in dep_items:
+            if debug:
                 self.log.newline()
 
             # Glob style source/dst for each node
             src_glob = utils.get_frame_glob_path(src_path)
-            self.log.debug("{:24}: {}".format("Source frame sequence",
-                                              src_glob))
+            self.log.debug("%-24s: %s", "Source frame sequence", src_glob)
 
             dst_glob = utils.get_frame_glob_path(data["packaged_path"])
-            self.log.debug("{:24}: {}".format("Packaged frame sequence",
-                                              dst_glob))
+            self.log.debug("%-24s: %s", "Packaged frame sequence", dst_glob)
 
-            # Specific frames
-            frames = []
+            # Specific frames (inclusive range)
+            frame_range = []
             if self.use_frame_limit:
                 start = data.get("start")
                 end = data.get("end")
                 if start is not None and end is not None:
-                    frames = list(range(start, end + 1))
+                    frame_range = [start, end]
 
             # Update metadata
             to_copy[src_glob] = {
                 "dst": dst_glob,
-                "frames": frames
+                "frame_range": frame_range
             }
 
         # Add extra files
+        # Skip any that are already in the dependency list
+        extra_files = set(self.extra_files)
+        new_extras = extra_files.difference(to_copy)
+        if self.log.isEnabledFor(logging.DEBUG):
+            for src_glob in sorted(extra_files.intersection(to_copy)):
+                self.log.debug("Skipping extra file copy. Already found in "
+                               "dependency list: %s", src_glob)
+
         for src_glob in self.extra_files:
-            if self.log.level == logging.DEBUG:
+            if src_glob not in new_extras:
+                continue
+            new_extras.discard(src_glob)
+
+            if debug:
                 self.log.newline()
 
             # Glob style source/dst for each node
-            self.log.debug("{:24}: {}".format("Extra frame sequence",
-                                              src_glob))
+            self.log.debug("%-24s: %s", "Extra frame sequence", src_glob)
 
             # Get dest dir for extra files
             dst = scene_packager_config.get_extra_packaged_path(
@@ -337,23 +400,16 @@ class Packager(object):
             )
             # Glob style
             dst_glob = utils.get_frame_glob_path(dst)
-            self.log.debug("{:24}: {}".format("Packaged frame sequence",
-                                              dst_glob))
+            self.log.debug("%-24s: %s", "Packaged frame sequence", dst_glob)
 
             # Update metadata
-            if src_glob in to_copy:
-                self.log.debug("Skipping extra file copy. Already found in "
-                               "dependency list: {0}".format(src_glob))
-            else:
-                to_copy[src_glob] = {
-                    "dst": dst_glob,
-                    "frames": []
-                }
+            to_copy[src_glob] = {
+                "dst": dst_glob,
+                "frame_range": []
+            }
 
         self.log.newline()
-        self.log.info(
-            "Found {} file dependencies".format(len(to_copy.items()))
-        )
+        self.log.info("Found %s file dependencies", len(to_copy))
 
         self.filecopy_metadata = to_copy
         return self.filecopy_metadata
@@ -397,21 +453,163 @@ class Packager(object):
         """
         self.log.debug("Loading scene data...")
 
-        self.root, self.dep_data, self.scene_start, self.scene_end = \
-            scene_packager_config.load_scene_data(
+        cache_path = self.scene_data_cache_path()
+        scene_data = None
+        if cache_path:
+            scene_data = self._load_cached_scene_data(cache_path)
+
+        if scene_data is None:
+            scene_data = scene_packager_config.load_scene_data(
                 self.packaged_scene, self.package_root, self.scene
             )
+            if cache_path:
+                self._save_cached_scene_data(cache_path, scene_data)
+        else:
+            self.log.debug("Using cached scene data: %s", cache_path)
+
+        self.root, self.dep_data, self.scene_start, self.scene_end = \
+            scene_data
+        # Filecopy metadata is rebuilt from the new scene data
+        self.filecopy_metadata = None
 
         self.log.debug("Finished.")
 
+    def scene_data_cache_path(self):
+        """
+        Get path of the cached load_scene_data result for this scene
+
+        Cache is keyed on the scene (path, mtime, size), the packaged scene
+        path within the package root, and the config/packager source files
+        that build the data. Packaged paths are cached relative to the
+        package root, so runs with different (Eg: dated) roots share it.
+        Disabled for dryrun mode, if $SCENE_PACKAGER_DISABLE_CACHE is set,
+        or if scene_packager_config.scene_data_cache_dir() returns None.
+
+        Returns:
+            Cache file path str, or None if cache is disabled
+        """
+        if self.mode >= 2 or os.environ.get("SCENE_PACKAGER_DISABLE_CACHE"):
+            return None
+
+        cache_dir = scene_packager_config.scene_data_cache_dir()
+        if not cache_dir:
+            return None
+
+        # Packaged scene must be in the package root to share the cache
+        root = self.package_root.rstrip("/") + "/"
+        packaged_scene = utils.clean_path(self.packaged_scene)
+        if not packaged_scene.startswith(root):
+            return None
+
+        key = [self.scene,
+               self._scene_stat.st_mtime,
+               self._scene_stat.st_size,
+               packaged_scene[len(root):],
+               self.settings["use_relative_paths"],
+               sys.version_info[:2]]
+
+        # Invalidate when config or packager code changes.
+        # Config functions may come from any --search-path config, and
+        # helper modules sit next to their config (Eg: nuke_packager_utils)
+        source_dirs = set([os.path.dirname(os.path.abspath(utils.__file__))])
+        for value in vars(scene_packager_config).values():
+            code = getattr(value, "__code__", None)
+            if code is not None:
+                source_dirs.add(
+                    os.path.dirname(os.path.abspath(code.co_filename))
+                )
+        for source_dir in sorted(source_dirs):
+            try:
+                names = sorted(os.listdir(source_dir))
+            except OSError:
+                continue
+            for name in names:
+                if not name.endswith(".py"):
+                    continue
+                src = os.path.join(source_dir, name)
+                try:
+                    src_stat = os.stat(src)
+                except OSError:
+                    continue
+                key.append((src, src_stat.st_mtime, src_stat.st_size))
+
+        return utils.join_path(
+            utils.clean_path(cache_dir),
+            "{0}{1}.pkl".format(self._SCENE_DATA_CACHE_PREFIX,
+                                utils.get_cache_key(*key))
+        )
+
+    def _load_cached_scene_data(self, cache_path):
+        """
+        Load cached scene data, with packaged paths under this package root
+
+        Args:
+            cache_path (str): Cache file path
+
+        Returns:
+            (root, dep_data, start, end), or None if there is no cache
+        """
+        scene_data = utils.load_cache(cache_path)
+        if scene_data is None:
+            return None
+
+        # Mark as recently used, for pruning
+        try:
+            os.utime(cache_path, None)
+        except OSError:
+            pass
+
+        root, dep_data, start, end = scene_data
+        package_root = self.package_root.rstrip("/")
+        for data in dep_data.values():
+            data["packaged_path"] = utils.join_path(package_root,
+                                                    data["packaged_path"])
+
+        return root, dep_data, start, end
+
+    def _save_cached_scene_data(self, cache_path, scene_data):
+        """
+        Cache scene data, with packaged paths relative to the package root
+        Not cached if any packaged path is outside the package root.
+
+        Args:
+            cache_path (str): Cache file path
+            scene_data (tuple): load_scene_data result
+                                (root, dep_data, start, end)
+
+        Returns:
+            True if the cache was written
+        """
+        root, dep_data, start, end = scene_data
+        package_root = self.package_root.rstrip("/") + "/"
+
+        cached_deps = {}
+        for src, data in dep_data.items():
+            dst = utils.clean_path(data["packaged_path"])
+            if not dst.startswith(package_root):
+                self.log.debug("Not caching scene data, packaged path is "
+                               "outside the package root: %s", dst)
+                return False
+
+            cached_deps[src] = dict(data,
+                                    packaged_path=dst[len(package_root):])
+
+        if not utils.save_cache(cache_path, (root, cached_deps, start, end)):
+            return False
+
+        utils.prune_cache(os.path.dirname(cache_path),
+                          self._SCENE_DATA_CACHE_PREFIX,
+                          self._SCENE_DATA_CACHE_SIZE)
+        return True
+
     def dependency_files(self):
         """
         Get scene dependency file paths
 
         Returns:
-            List of filepath str
+            Tuple of filepath str
         """
-        return self.dep_data.keys()
+        return tuple(self.dep_data)
 
     def write_filecopy_metadata(self):
         """
@@ -430,9 +628,12 @@ class Packager(object):
             self.log.info("Filecopy metadata path:")
             self.log.info(self.package_filecopy_metadata_path)
             filecopy_data = self.get_filecopy_metadata()
-            self.log.debug(
-                "Filecopy metadata:\n" + pprint.pformat(filecopy_data)
-            )
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(
+                    "Filecopy metadata:\n%s",
+                    json.dumps(filecopy_data, indent=2,
+                               separators=(",", ": "), default=str)
+                )
 
     def write_package_metadata(self):
         """
@@ -451,9 +652,9 @@ class Packager(object):
         else:
             self.log.info("Package metadata path:")
             self.log.info(self.package_metadata_path)
-            self.log.debug(
-                "Package metadata:\n" + pprint.pformat(self.package_metadata())
-            )
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("Package metadata:\n%s",
+                               pprint.pformat(self.package_metadata()))
 
     def write_packaged_scene(self):
         """
@@ -520,14 +721,12 @@ class Packager(object):
         # Mode 0 only
         if 0 == self.mode:
             batch_copy.copy_files(
-                self.filecopy_metadata, log_level=self.log.level
+                self.get_filecopy_metadata(), log_level=self.log.level
             )
         else:
             self.log.newline()
-            self.log.info(
-                "Skipping file copy for packager mode {} ({} mode)".format(
-                    self.mode, self.mode_str)
-            )
+            self.log.info("Skipping file copy for packager mode %s (%s mode)",
+                          self.mode, self.mode_str)
 
         self.log.debug("End packaging")
 
@@ -555,9 +754,7 @@ class Packager(object):
             mode (bool): If True, do not submit copy job,
                         only write packaged scene and metadata.
         """
-        self.log.info(
-            "Running scene packager [overwrite={0}]".format(overwrite)
-        )
+        self.log.info("Running scene packager [overwrite=%s]", overwrite)
         self.set_mode(mode)
 
         # Check for existing package
@@ -592,13 +789,12 @@ class Packager(object):
         # Finished!
         # Print confirmation for normal, nocopy modes
         self.log.newline()
-        self.log.info("*" * 50)
+        self.log.info(utils.BANNER)
         if self.mode < 2:
             self.log.info("Package complete!")
-            self.log.info("Completed package root: {}".format(
-                self.package_root))
+            self.log.info("Completed package root: %s", self.package_root)
             # Open scene
             scene_packager_config.open_packaged_scene(self.packaged_scene)
         else:
             self.log.info("Dryrun finished!")
-        self.log.info("*" * 50)
+        self.log.info(utils.BANNER)
@@ -9,8 +9,6 @@ Any functions not overridden will use the default implementations below.
 """
 
 # Standard
-from datetime import datetime
-import getpass
 import os
 
 # Scene packager
@@ -24,12 +22,13 @@ def package_root(source_scene):
     """
     Get root directory of a new scene package
     """
+    date, user = scene_packager.utils.get_run_context()
     return os.path.join(
         os.path.expandvars("S:/ANIMA/projects/$LAUNCHAPP_PROJECT/user"),
-        getpass.getuser(),
+        user,
         "scene_packager",
         "nuke",
-        datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        date
     )
 
 
@@ -46,6 +45,18 @@ def package_tmp_dir(source_scene):
     )
 
 
+def scene_data_cache_dir():
+    """
+    Directory where loaded scene data is cached between runs.
+    Disabled (None) by default. To enable, override and return a dir, e.g.
+    os.path.join(os.path.expanduser("~"), ".cache", "scene_packager")
+
+    Returns:
+        str, or None to disable the cache
+    """
+    return None
+
+
 def packaged_scene_path(source_scene, package_root):
     """
     Get path where packaged scene will be written to
@@ -109,11 +120,12 @@ def package_metadata(scene, settings):
     """
     Add keys to the package metadata file
     """
+    date, user = scene_packager.utils.get_run_context()
     metadata = {
-        "date": datetime.now().strftime("%Y-%m-%d_%H%M%S"),
+        "date": date,
         "package_settings": settings,
         "source_scene": scene,
-        "user": getpass.getuser(),
+        "user": user,
     }
     # Add search path for config files
     try:
@@ -1,30 +1,77 @@
 # -*- coding: utf-8 -*-
 # Standard
-from datetime import datetime
 import errno
-from glob import glob
+import getpass
+import hashlib
+import itertools
 import json
 import logging
 import os
-import platform
+import pickle
 import re
 import shutil
-import subprocess
-import tempfile
-import traceback
+import sys
+import time
 import types
 
+# Optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Globals
 CONFIG = None
+# (date str, user) for the current package run. See get_run_context()
+_RUN_CONTEXT = None
+# Fixed run date str. See set_run_timestamp()
+_RUN_TIMESTAMP = None
 
 # Frame regex
+# (Matched with string checks in _find_frame_pad, kept for reference)
 FRAME_PAD_REGEX = r"(?<=[_\.])(?P<frame>#+|\d+|\%\d*d)$"
 FRAME_PAD_FMT_REGEX = r"(?<=[_\.])(?P<frame>#+|\%\d*d)$"
+_DIGITS = "0123456789"
+# Version dir regex
+_VERSION_DIR_RE = re.compile(r"/v\d+/")
 
 # Default log level
 SCENE_PACKAGER_LOG_LEVEL = logging.WARNING
 
+# Log formatters
+_FORMATTER = logging.Formatter("%(levelname)-8s: %(message)s")
+_DEBUG_FORMATTER = logging.Formatter(
+    "%(name)-15s %(levelname)-8s: %(message)s")
+_BLANK_FORMATTER = logging.Formatter(fmt="")
+
+# Log separator lines
+BANNER = "*" * 50
+DIVIDER = "-" * 50
+
+# Compiled config regex, by pattern str
+_REGEX_CACHE = {}
+# (mtime, size, package root) from package metadata, by path
+_METADATA_ROOT_CACHE = {}
+# Max metadata files in _METADATA_ROOT_CACHE (cleared when full)
+_METADATA_ROOT_CACHE_SIZE = 128
+# str.format_map is Python 3 only
+_HAS_FORMAT_MAP = hasattr(str, "format_map")
+# Combined rename regex, by tuple of rename pattern strs
+_RENAME_PREFILTER_CACHE = {}
+# Group refs and global flags change meaning when patterns are combined
+_UNCOMBINABLE_RE = re.compile(r"\\[1-9]|\(\?\(|\(\?[aiLmsux]+\)")
+# sub_chars ops, by tuple of sub_chars items. See _get_sub_ops()
+_SUB_OPS_CACHE = {}
+# Regex special chars, sub_chars keys without these are literal
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+
+class SceneNotFoundError(ValueError):
+    """
+    Input scene file does not exist
+    """
+
 
 def log_blank_line(self, count=1):
     """
@@ -58,6 +105,12 @@ def get_logger(logger_name, level=None):
         level = SCENE_PACKAGER_LOG_LEVEL
 
     log = logging.getLogger(logger_name)
+    # Already set up at this level
+    output_handler = getattr(log, "output_handler", None)
+    if (output_handler is not None and level == log.level and
+            level == output_handler.level):
+        return log
+
     log.setLevel(level)
     log.propagate = False
 
@@ -70,19 +123,18 @@ def get_logger(logger_name, level=None):
         handler.setLevel(level)
 
         if level == logging.DEBUG:
-            formatter = logging.Formatter(
-                "%(name)-15s %(levelname)-8s: %(message)s"
-            )
+            handler.setFormatter(_DEBUG_FORMATTER)
         else:
-            formatter = logging.Formatter("%(levelname)-8s: %(message)s")
+            handler.setFormatter(_FORMATTER)
 
-        handler.setFormatter(formatter)
         log.addHandler(handler)
 
-    # Add blank line handler
-    blank_handler = logging.StreamHandler()
+    # Add blank line handler (once per logger)
+    blank_handler = getattr(log, "blank_handler", None)
+    if blank_handler is None:
+        blank_handler = logging.StreamHandler()
+        blank_handler.setFormatter(_BLANK_FORMATTER)
     blank_handler.setLevel(level)
-    blank_handler.setFormatter(logging.Formatter(fmt=""))
 
     # Add log.newline() method
     log.output_handler = handler
@@ -92,6 +144,114 @@ def get_logger(logger_name, level=None):
     return log
 
 
+# Module logger. See set_log_level()
+LOG = get_logger(__name__)
+
+
+def set_log_level(level):
+    """
+    Set the default scene packager log level, and the utils module logger
+
+    Args:
+        level (int): Logger level (logging.WARNING, etc)
+    """
+    global SCENE_PACKAGER_LOG_LEVEL
+    SCENE_PACKAGER_LOG_LEVEL = level
+    get_logger(__name__, level)
+
+
+def get_run_context():
+    """
+    Get date and user for the current package run.
+    Computed once per run, so all config hooks use the same values.
+
+    Returns:
+        (date (str), user (str)) tuple
+    """
+    global _RUN_CONTEXT
+    if _RUN_CONTEXT is None:
+        _RUN_CONTEXT = (
+            _RUN_TIMESTAMP or time.strftime("%Y-%m-%d_%H%M%S"),
+            getpass.getuser()
+        )
+
+    return _RUN_CONTEXT
+
+
+def reset_run_context():
+    """
+    Clear the cached run date/user, so they are recomputed for the next run
+    """
+    global _RUN_CONTEXT
+    _RUN_CONTEXT = None
+
+
+def set_run_timestamp(timestamp=None):
+    """
+    Use a fixed run date for all following package runs.
+    Eg: For deterministic package roots and metadata
+
+    Args:
+        timestamp (str, optional): Date str. Eg: "2020-01-01_120000"
+                                   If None, use the current time per run.
+    """
+    global _RUN_TIMESTAMP
+    _RUN_TIMESTAMP = timestamp
+    reset_run_context()
+
+
+def _compile_regex(pattern):
+    """
+    Get compiled regex for a config pattern str (compiled once per pattern)
+
+    Args:
+        pattern (str): Regex pattern
+
+    Returns:
+        Compiled regex
+    """
+    try:
+        return _REGEX_CACHE[pattern]
+    except KeyError:
+        regex = _REGEX_CACHE[pattern] = re.compile(pattern)
+        return regex
+
+
+def _find_frame_pad(base, fmt_only=False):
+    """
+    Find the frame pad at the end of a filename without ext.
+    Same matches as FRAME_PAD_REGEX (or FRAME_PAD_FMT_REGEX if fmt_only),
+    for ascii digits, without going through the regex engine.
+
+    Args:
+        base (str): Filepath without ext
+        fmt_only (bool, optional): Only match #### or %04d style pads,
+                                   not frame numbers
+
+    Returns:
+        Index where the frame pad starts, or -1 if there is none
+    """
+    # Pad follows the last _ or .
+    start = max(base.rfind("."), base.rfind("_")) + 1
+    if not start:
+        return -1
+
+    pad = base[start:]
+    if not pad:
+        return -1
+    # ####
+    if "#" == pad[0]:
+        is_pad = not pad.strip("#")
+    # %04d
+    elif "%" == pad[0]:
+        is_pad = "d" == pad[-1] and not pad[1:-1].strip(_DIGITS)
+    # 1001
+    else:
+        is_pad = not fmt_only and not pad.strip(_DIGITS)
+
+    return start if is_pad else -1
+
+
 def get_frame_glob_path(filepath):
     """
     Get glob style path for frames
@@ -105,13 +265,10 @@ def get_frame_glob_path(filepath):
     path = clean_path(filepath)
     base, ext = os.path.splitext(path)
 
-    glob_base = re.sub(FRAME_PAD_REGEX, "*", base)
-    seq_path = glob_base + ext
-
-    # Verify glob
-    glob(seq_path)
-
-    return seq_path
+    start = _find_frame_pad(base)
+    if start < 0:
+        return base + ext
+    return base[:start] + "*" + ext
 
 
 def clean_path(path):
@@ -121,6 +278,28 @@ def clean_path(path):
     return path.replace("\\", "/")
 
 
+def join_path(path, *parts):
+    """
+    Join clean (forward slash) path parts.
+    Cheaper than os.path.join + clean_path for already clean paths.
+
+    Args:
+        path (str): Clean parent path
+        *parts (str): Clean relative path parts. Empty parts are skipped.
+
+    Returns:
+        Joined path str
+    """
+    parts = [part for part in parts if part]
+    if not path:
+        return "/".join(parts)
+    if not parts:
+        return path
+    if path.endswith("/"):
+        return path + "/".join(parts)
+    return path + "/" + "/".join(parts)
+
+
 def make_dirs(dirs):
     """
     Create a directory path if it doesn't already exist
@@ -131,6 +310,10 @@ def make_dirs(dirs):
     Raises:
         OSError if directories cannot be created
     """
+    # Common case, skip raising and catching EEXIST
+    if os.path.isdir(dirs):
+        return
+
     try:
         os.makedirs(dirs)
     except OSError as e:
@@ -139,7 +322,107 @@ def make_dirs(dirs):
             raise
 
 
-def copy_file(src_file, dest_file, verbose=False, overwrite=False):
+def _cpu_count():
+    """
+    Get number of CPUs (os.cpu_count is Python 3 only)
+
+    Returns:
+        CPU count int, 1 if it cannot be determined
+    """
+    if hasattr(os, "cpu_count"):
+        return os.cpu_count() or 1
+
+    # Python 2
+    import multiprocessing
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def _copy_file_range(src_fd, dst_fd):
+    """
+    Copy all data between file descriptors with os.copy_file_range
+
+    Returns:
+        Number of bytes copied
+    """
+    copied = 0
+    while True:
+        sent = os.copy_file_range(src_fd, dst_fd, 1024 * 1024 * 1024)
+        if not sent:
+            return copied
+        copied += sent
+
+
+def _sendfile(src_fd, dst_fd):
+    """
+    Copy all data between file descriptors with os.sendfile
+
+    Returns:
+        Number of bytes copied
+    """
+    offset = 0
+    while True:
+        sent = os.sendfile(dst_fd, src_fd, offset, 1024 * 1024 * 1024)
+        if not sent:
+            return offset
+        offset += sent
+
+
+# In-kernel copy functions to try, in order
+_KERNEL_COPY_FUNCS = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPY_FUNCS.append(_copy_file_range)
+# (Python 3.8+ shutil.copyfile already uses sendfile on Linux)
+if (sys.platform.startswith("linux") and hasattr(os, "sendfile") and
+        sys.version_info < (3, 8)):
+    _KERNEL_COPY_FUNCS.append(_sendfile)
+
+
+def _copy_file_data(src_file, dest_file):
+    """
+    Copy file contents.
+    Uses os.copy_file_range where available, so data stays in the kernel
+    (and can be reflinked on copy-on-write filesystems).
+    On Linux before Python 3.8, os.sendfile is used.
+    Falls back to shutil.copyfile, including when an in-kernel copy
+    stops short of the source size (some FUSE/network/pseudo filesystems
+    report success without copying anything).
+
+    Args:
+        src_file (str): Source file path
+        dest_file (str): Destination file path
+    """
+    if _KERNEL_COPY_FUNCS:
+        # Same file. Let shutil raise its error, don't truncate the source.
+        try:
+            same_file = os.path.samefile(src_file, dest_file)
+        except OSError:
+            same_file = False
+
+        if not same_file:
+            for copy_func in _KERNEL_COPY_FUNCS:
+                try:
+                    with open(src_file, "rb") as src, \
+                            open(dest_file, "wb") as dst:
+                        size = os.fstat(src.fileno()).st_size
+                        copied = copy_func(src.fileno(), dst.fileno())
+                    # Complete copy
+                    if copied >= size:
+                        return
+                except OSError as e:
+                    # Not supported for these files/filesystems
+                    if e.errno not in (errno.EXDEV, errno.ENOSYS,
+                                       errno.EINVAL, errno.EOPNOTSUPP,
+                                       errno.ENOTSUP, errno.ETXTBSY):
+                        raise
+
+    shutil.copyfile(src_file, dest_file)
+
+
+def copy_file(src_file, dest_file, verbose=False, overwrite=False,
+              dest_exists=None, made_dirs=None):
     """
     Copy textures to the publish dir relative to a Maya scene file
 
@@ -149,33 +432,108 @@ def copy_file(src_file, dest_file, verbose=False, overwrite=False):
         verbose (bool): If True, print log info
         overwrite (bool): If True, allow overwriting dest file
                           when it already exists
+        dest_exists (bool, optional): Whether dest file already exists,
+                                      if already known (skips the check)
+        made_dirs (set, optional): Dirs already created by the caller.
+                                   Dest parent dir is added once created.
 
     Returns:
         Destination file str
     """
-    log = get_logger(__name__)
-
     src_file = clean_path(src_file)
     dest_file = clean_path(dest_file)
 
     # Don't overwrite existing file
-    if os.path.isfile(dest_file) and not overwrite:
+    if dest_exists is None:
+        dest_exists = os.path.isfile(dest_file)
+    if dest_exists and not overwrite:
         return dest_file
 
     # Make parent dir
-    make_dirs(os.path.dirname(dest_file))
+    parent_dir = os.path.dirname(dest_file)
+    if made_dirs is None or parent_dir not in made_dirs:
+        make_dirs(parent_dir)
+        if made_dirs is not None:
+            made_dirs.add(parent_dir)
 
     # Copy
     try:
-        shutil.copyfile(src_file, dest_file)
+        _copy_file_data(src_file, dest_file)
         if verbose:
-            log.info("Copied '{0}' to {1}".format(src_file, dest_file))
+            LOG.info("Copied '{0}' to {1}".format(src_file, dest_file))
     except (IOError, OSError):
         raise
 
     return dest_file
 
 
+def copy_files(pairs, overwrite=False, workers=None, verbose=False):
+    """
+    Copy a batch of files, in parallel threads if possible.
+    (File copies release the GIL)
+
+    Args:
+        pairs (iterable): (Source file path, destination file path) pairs
+        overwrite (bool): If True, allow overwriting dest files
+                          when they already exist
+        workers (int, optional): Max copy threads.
+                                 Defaults to min(32, cpu count * 4)
+        verbose (bool): If True, log the copied files (once per batch)
+
+    Raises:
+        First copy error, if any copy fails
+
+    Returns:
+        List of destination file str
+    """
+    pairs = [(clean_path(src), clean_path(dst)) for src, dst in pairs]
+
+    # Make each unique dest dir once, before copying
+    made_dirs = set()
+    for src, dst in pairs:
+        parent_dir = os.path.dirname(dst)
+        if parent_dir not in made_dirs:
+            make_dirs(parent_dir)
+            made_dirs.add(parent_dir)
+
+    def _copy(pair):
+        # Existing dest files are skipped unless overwriting
+        dest_exists = os.path.isfile(pair[1])
+        dst = copy_file(pair[0], pair[1], overwrite=overwrite,
+                        dest_exists=dest_exists, made_dirs=made_dirs)
+        return dst, overwrite or not dest_exists
+
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        # Python 2 (no futures backport)
+        ThreadPoolExecutor = None
+
+    # (dest file, whether it was copied) per finished pair
+    results = []
+    try:
+        if ThreadPoolExecutor is None or len(pairs) < 2 or 1 == workers:
+            for pair in pairs:
+                results.append(_copy(pair))
+        else:
+            if not workers:
+                workers = min(32, _cpu_count() * 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results.extend(executor.map(_copy, pairs))
+    finally:
+        # Log the batch in one write, not one per file
+        if verbose and results:
+            lines = ["Copied '{0}' to {1}".format(pair[0], dst)
+                     for pair, (dst, copied) in zip(pairs, results)
+                     if copied]
+            skipped = len(results) - len(lines)
+            if skipped:
+                lines.append("Skipped {0} existing file(s)".format(skipped))
+            LOG.info("\n".join(lines))
+
+    return [dst for dst, _ in results]
+
+
 def save_json(path, data, overwrite=False):
     """
     Save json data
@@ -190,9 +548,19 @@ def save_json(path, data, overwrite=False):
     Returns: None
     """
     try:
-        with open(path, mode="w") as handle:
-            json.dump(data, handle, indent=4)
+        # Faster dump if orjson is available
+        if orjson is not None:
+            with open(path, mode="wb") as handle:
+                handle.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        # Encode up front and write once, json.dump writes per token
+        else:
+            text = json.dumps(data, indent=4)
+            with open(path, mode="w") as handle:
+                handle.write(text)
     except Exception:
+        import traceback
         traceback.print_exc()
         raise
 
@@ -203,14 +571,159 @@ def load_json(path, **kwargs):
 
     Args:
         path (str): Filepath to load
+        kwargs: json.load kwargs (orjson is only used if there are none)
 
     Returns:
         Data dict
     """
     with open(path, mode="rb") as handle:
+        # Faster load if orjson is available
+        if orjson is not None and not kwargs:
+            return orjson.loads(handle.read())
+
         return json.load(handle, **kwargs)
 
 
+def load_json_files(paths, workers=None):
+    """
+    Load json files using a thread pool, to overlap file reads.
+    Each load starts as soon as its path is yielded, so a lazy search
+    (Eg: iter_existing_packages) overlaps with the loads.
+
+    Args:
+        paths (iterable): Filepaths to load
+        workers (int, optional): Max load threads.
+                                 Defaults to min(32, cpu count + 4)
+
+    Returns:
+        List of data dicts, in the same order as paths
+    """
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        # Python 2 (no futures backport)
+        ThreadPoolExecutor = None
+
+    if ThreadPoolExecutor is None or 1 == workers:
+        return [load_json(path) for path in paths]
+
+    workers = workers or min(32, _cpu_count() + 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(load_json, path) for path in paths]
+        return [future.result() for future in futures]
+
+
+def get_cache_key(*parts):
+    """
+    Get hash str to use as a cache key
+
+    Args:
+        parts: Values that identify the cached data
+
+    Returns:
+        Hex digest str
+    """
+    return hashlib.md5(repr(parts).encode("utf8")).hexdigest()
+
+
+def load_cache(path):
+    """
+    Load pickled cache data
+
+    Args:
+        path (str): Cache file path
+
+    Returns:
+        Cached data, or None if there is no readable cache at path
+    """
+    try:
+        with open(path, mode="rb") as handle:
+            return pickle.load(handle)
+    except (IOError, OSError):
+        return None
+    except Exception:
+        # Corrupt or incompatible cache. Treat as a miss.
+        LOG.debug("Failed to load cache: {}".format(path), exc_info=True)
+        return None
+
+
+def save_cache(path, data):
+    """
+    Pickle cache data. Written to a tmp file first and renamed,
+    so readers never see a partially written cache.
+    Failures are logged and ignored.
+
+    Args:
+        path (str): Cache file path
+        data: Data to pickle
+
+    Returns:
+        True if the cache was written
+    """
+    tmp_path = "{0}.{1}.tmp".format(path, os.getpid())
+    try:
+        make_dirs(os.path.dirname(path))
+        with open(tmp_path, mode="wb") as handle:
+            pickle.dump(data, handle, pickle.HIGHEST_PROTOCOL)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # Windows won't rename over an existing file
+            os.remove(path)
+            os.rename(tmp_path, path)
+    except Exception:
+        LOG.debug("Failed to write cache: {}".format(path), exc_info=True)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+    return True
+
+
+def prune_cache(cache_dir, prefix, keep):
+    """
+    Remove the least recently used cache files in a cache dir
+    Failures are logged and ignored.
+
+    Args:
+        cache_dir (str): Cache dir
+        prefix (str): Only cache files with this basename prefix are pruned
+        keep (int): Number of most recently used cache files to keep
+
+    Returns:
+        Number of removed cache files
+    """
+    try:
+        names = [n for n in os.listdir(cache_dir) if n.startswith(prefix)]
+    except OSError:
+        return 0
+    if len(names) <= keep:
+        return 0
+
+    # Newest first (cache hits touch their file)
+    paths = []
+    for name in names:
+        path = join_path(cache_dir, name)
+        try:
+            paths.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+    paths.sort(reverse=True)
+
+    removed = 0
+    for _, path in paths[keep:]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            LOG.debug("Failed to remove cache: {}".format(path),
+                      exc_info=True)
+
+    return removed
+
+
 def get_relative_path(package_scene, package_dependency, package_root):
     """
     Get relative path (Eg: '../../images/test.1001.exr')
@@ -233,9 +746,10 @@ def get_relative_path(package_scene, package_dependency, package_root):
     assert(package_dependency.startswith(package_root))
     assert(package_scene.startswith(package_root))
 
-    dep_stub = re.sub(package_root, "", package_dependency)
+    # Strip package root prefix
+    dep_stub = package_dependency[len(package_root):]
     dep_stub = dep_stub.strip("/")
-    scene_stub = re.sub(package_root, "", package_scene)
+    scene_stub = package_scene[len(package_root):]
     # Dependency must be in a subdir within the package
     if not dep_stub:
         raise ValueError("Scene file dependency must be in a subdir. "
@@ -246,11 +760,11 @@ def get_relative_path(package_scene, package_dependency, package_root):
     # Scene is directly in package root dir
     # No directory up syntax needed
     if 1 == len(scene_dirs):
-        return clean_path(os.path.join(".", dep_stub))
+        return "./" + dep_stub
     # Add '..' for each directory up
     else:
-        dirs_up = "/".join([".." for x in range(len(scene_dirs) - 1)])
-        return clean_path(os.path.join(dirs_up, dep_stub))
+        dirs_up = "/".join([".."] * (len(scene_dirs) - 1))
+        return dirs_up + "/" + dep_stub
 
 
 def basic_package_dst_path(src_path, dst_dir):
@@ -268,22 +782,130 @@ def basic_package_dst_path(src_path, dst_dir):
     dst_dir = clean_path(dst_dir)
 
     # Use subdirs from version dir down
-    match = re.search("\/v\d+\/", src_path)
+    match = _VERSION_DIR_RE.search(src_path)
     if match:
-        return clean_path(
-            os.path.join(dst_dir, src_path[match.start() + 1:]))
+        return join_path(dst_dir, src_path[match.start() + 1:])
 
     # If no version dir, use subdir named after file
     # Remove frame pad (#### or %04d style only)
-    base = os.path.splitext(os.path.basename(src_path))[0]
+    basename = src_path.rpartition("/")[2]
+    base = basename.rpartition(".")[0]
+    # No ext (leading dots do not start an ext)
+    if not base.strip("."):
+        base = basename
     # Glob style
     if "*" == base:
         subdir = ""
     else:
-        subdir = re.sub(FRAME_PAD_FMT_REGEX, "", base)
+        start = _find_frame_pad(base, fmt_only=True)
+        subdir = base[:start] if start >= 0 else base
+
+    return join_path(dst_dir, subdir, basename)
+
+
+def _get_rename_prefilter(regexes):
+    """
+    Get a single compiled regex that matches if any rename regex matches
+
+    Args:
+        regexes (tuple): Rename pattern regex strs
+
+    Returns:
+        Compiled regex, or None if the patterns cannot be combined
+    """
+    try:
+        return _RENAME_PREFILTER_CACHE[regexes]
+    except KeyError:
+        pass
+
+    prefilter = None
+    # (Only combine pattern strs, not precompiled regexes)
+    if all(not hasattr(regex, "pattern") and
+           not _UNCOMBINABLE_RE.search(regex) for regex in regexes):
+        try:
+            prefilter = re.compile(
+                "|".join("(?:{0})".format(regex) for regex in regexes)
+            )
+        except re.error:
+            # Eg: Same group name used in multiple patterns
+            prefilter = None
 
-    return clean_path(
-        os.path.join(dst_dir, subdir, os.path.basename(src_path)))
+    _RENAME_PREFILTER_CACHE[regexes] = prefilter
+    return prefilter
+
+
+def _get_literal_char(pattern):
+    """
+    Get the char a sub_chars pattern matches, if it is a single literal char
+
+    Args:
+        pattern (str): Regex pattern. Eg: "-" or "\\."
+
+    Returns:
+        Literal char str, or None if pattern needs regex matching
+    """
+    # Precompiled regex
+    if hasattr(pattern, "pattern"):
+        return None
+    if len(pattern) == 1 and pattern not in _REGEX_META:
+        return pattern
+    # Escaped punctuation
+    if (len(pattern) == 2 and pattern[0] == "\\" and
+            ord(pattern[1]) < 128 and not pattern[1].isalnum()):
+        return pattern[1]
+    return None
+
+
+def _get_sub_ops(subs):
+    """
+    Get substitution ops for config sub_chars data (built once per data)
+
+    Single literal chars are swapped with str.replace, other patterns
+    use regex substitution.
+
+    Args:
+        subs (dict): Regex pattern and replacement str data
+
+    Returns:
+        List of (literal char or None, compiled regex or None, replacement)
+    """
+    key = tuple(subs.items())
+    try:
+        return _SUB_OPS_CACHE[key]
+    except KeyError:
+        pass
+
+    ops = []
+    for k, v in key:
+        char = _get_literal_char(k)
+        # Backslashes in a regex replacement are escapes, not literals
+        if char is not None and "\\" not in v:
+            ops.append((char, None, v))
+        else:
+            ops.append((None, _compile_regex(k), v))
+
+    _SUB_OPS_CACHE[key] = ops
+    return ops
+
+
+def _sub_chars(text, subs):
+    """
+    Apply config sub_chars substitutions in order
+
+    Args:
+        text (str): Text to sub
+        subs (dict): Regex pattern and replacement str data
+
+    Returns:
+        Subbed str
+    """
+    for char, regex, v in _get_sub_ops(subs):
+        if regex is None:
+            text = text.replace(char, v)
+        else:
+            text = regex.sub(v, text)
+
+    return text
 
 
 def get_renamed_dst_path(src_path, patterns):
@@ -298,12 +920,18 @@ def get_renamed_dst_path(src_path, patterns):
     Returns:
         Subbed filepath str if there was a match
     """
-    log = get_logger(__name__)
-
     renamed = ""
     matched = []
+
+    # Skip per-pattern checks if no pattern matches
+    prefilter = _get_rename_prefilter(
+        tuple(data["regex"] for data in patterns)
+    )
+    if prefilter is not None and not prefilter.search(src_path):
+        return renamed
+
     for data in patterns:
-        match = re.search(data["regex"], src_path)
+        match = _compile_regex(data["regex"]).search(src_path)
         # Only use first available match
         if match and not renamed:
             # Sub chars
@@ -311,9 +939,7 @@ def get_renamed_dst_path(src_path, patterns):
             subs = data.get("sub_chars", {})
             for grp_name, match_str in match.groupdict().items():
                 if subs.get(grp_name):
-                    subbed_str = match_str
-                    for k, v in subs[grp_name].items():
-                        subbed_str = re.sub(k, v, subbed_str)
+                    subbed_str = _sub_chars(match_str, subs[grp_name])
 
                     try:
                         match_dict[grp_name] = int(subbed_str)
@@ -325,7 +951,11 @@ def get_renamed_dst_path(src_path, patterns):
                     except ValueError:
                         match_dict[grp_name] = match_str
 
-            renamed = data["format_str"].format(**match_dict)
+            # Skip copying match dict into kwargs where possible
+            if _HAS_FORMAT_MAP:
+                renamed = data["format_str"].format_map(match_dict)
+            else:
+                renamed = data["format_str"].format(**match_dict)
 
         # Track all matches for error
         if match:
@@ -333,15 +963,15 @@ def get_renamed_dst_path(src_path, patterns):
 
     # Cannot resolve multiple pattern matches
     if matched and len(matched) > 1:
-        log.error("-" * 50)
+        LOG.error(DIVIDER)
         msg = "Source path has multiple pattern matches: {0}".format(src_path)
-        log.error(msg)
-        log.error("-" * 50)
+        LOG.error(msg)
+        LOG.error(DIVIDER)
         for m, d in matched:
-            log.error("Description: {0}".format(m.get("desc", "")))
-            log.error("Regex:       {0}".format(m.get("regex", "")))
-            log.error("Match dict:  {0}".format(d))
-            log.error("-" * 50)
+            LOG.error("Description: {0}".format(m.get("desc", "")))
+            LOG.error("Regex:       {0}".format(m.get("regex", "")))
+            LOG.error("Match dict:  {0}".format(d))
+            LOG.error(DIVIDER)
         raise ValueError(msg)
 
     return renamed
@@ -381,6 +1011,31 @@ def write_package_metadata(metadata, metadata_path):
     return path
 
 
+def _dir_nonempty(path):
+    """
+    Check whether a dir has any entries, without listing all of them
+
+    Args:
+        path (str): Dir path
+
+    Raises:
+        OSError if dir cannot be read (Eg: errno.ENOENT if it does not exist)
+
+    Returns:
+        bool
+    """
+    # Python 2
+    if not hasattr(os, "scandir"):
+        return bool(os.listdir(path))
+
+    entries = os.scandir(path)
+    try:
+        return next(entries, None) is not None
+    finally:
+        if hasattr(entries, "close"):
+            entries.close()
+
+
 def check_package_exists(packager):
     """
     Check whether a package exists
@@ -393,7 +1048,7 @@ def check_package_exists(packager):
     """
     # Check for existing package
     try:
-        if os.listdir(packager.package_root):
+        if _dir_nonempty(packager.package_root):
             return True
     except OSError as e:  # DNE
         if e.errno != errno.ENOENT:
@@ -414,7 +1069,7 @@ def check_available_dir(root):
         bool
     """
     try:
-        if os.listdir(root):
+        if _dir_nonempty(root):
             return False
     except OSError as e:  # DNE
         if e.errno != errno.ENOENT:
@@ -423,29 +1078,93 @@ def check_available_dir(root):
     return True
 
 
-def find_existing_packages(root_dir, metadata_file):
+def iter_existing_packages(root_dir, metadata_file):
     """
-    Find existing package metadata under directory root
+    Find existing package metadata under directory root, one at a time
 
     Args:
-        package_root (str): Root dir
+        root_dir (str): Root dir
         metadata_file (str): Metadata file basename
 
-    Returns:
-        List of package metadata paths
+    Raises:
+        OSError if root dir does not exist
+
+    Yields:
+        Package metadata paths
     """
     # Doesn't exist yet
     if not os.path.exists(root_dir):
         raise OSError("{} does not exist".format(root_dir))
 
     # Find existing package metadatas
-    existing = []
     name = metadata_file
-    for root, dirs, files in os.walk(root_dir):
-        if name in files:
-            existing.append(os.path.join(root, name))
+    # Python 2
+    if not hasattr(os, "scandir"):
+        for root, dirs, files in os.walk(root_dir):
+            if name in files:
+                yield os.path.join(root, name)
+        return
+
+    # Walk with scandir (dir entry types come with the listing, no stat)
+    # Same as os.walk: unreadable dirs are skipped, dir links not followed
+    to_search = [root_dir]
+    while to_search:
+        try:
+            entries = list(os.scandir(to_search.pop()))
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif name == entry.name:
+                yield entry.path
+        # Search subdirs in listed order
+        to_search.extend(reversed(subdirs))
 
-    return existing
+
+def find_existing_packages(root_dir, metadata_file):
+    """
+    Find existing package metadata under directory root
+
+    Args:
+        root_dir (str): Root dir
+        metadata_file (str): Metadata file basename
+
+    Returns:
+        List of package metadata paths
+    """
+    return list(iter_existing_packages(root_dir, metadata_file))
+
+
+def _get_metadata_package_root(path):
+    """
+    Get the package root saved in a package metadata file
+    The file is only re-read if it has changed since it was last read.
+
+    Args:
+        path (str): Package metadata filepath
+
+    Returns:
+        Package root str, or None if not in the metadata
+    """
+    st = os.stat(path)
+    stamp = (getattr(st, "st_mtime_ns", st.st_mtime), st.st_size)
+    cached = _METADATA_ROOT_CACHE.get(path)
+    if cached is not None and cached[:2] == stamp:
+        return cached[2]
+
+    data = load_json(path)
+    root = data.get("package_settings", {}).get("package_root")
+
+    # One entry per file (rewrites replace it), capped for long sessions
+    if (path not in _METADATA_ROOT_CACHE and
+            len(_METADATA_ROOT_CACHE) >= _METADATA_ROOT_CACHE_SIZE):
+        _METADATA_ROOT_CACHE.clear()
+    _METADATA_ROOT_CACHE[path] = stamp + (root,)
+    return root
 
 
 def check_existing_package(package_root, metadata_file):
@@ -470,33 +1189,38 @@ def check_existing_package(package_root, metadata_file):
         True if package metdata is found
         False if no package metadata is found or dir does not exist
     """
-    log = get_logger(__name__)
     package_root = os.path.abspath(package_root)
 
     # Get existing package metadata files
+    # (Stop at 2, more than 1 is already an error)
     try:
-        existing = find_existing_packages(package_root, metadata_file)
+        existing = list(itertools.islice(
+            iter_existing_packages(package_root, metadata_file), 2
+        ))
     except OSError:
         return False
 
     MANUAL_REQ = "Manually delete this dir to use it as a package root."
+    # Empty dir
+    if not existing and not _dir_nonempty(package_root):
+        return False
     # No packages found in this dir
-    if 0 == len(existing) and os.listdir(package_root):
+    elif 0 == len(existing):
         # No packages found, but there is something else in this dir.
         # Tool can't resolve this.
         msg = "No existing {0} found in package root dir.\nI can't tell " \
             "if this is an old package or not.\n{1}\n{2}".format(
                 metadata_file, MANUAL_REQ, package_root)
         # Log
-        log.newline()
-        log.error("*" * 50)
-        log.error("Failed Package Overwrite")
-        log.newline()
+        LOG.newline()
+        LOG.error(BANNER)
+        LOG.error("Failed Package Overwrite")
+        LOG.newline()
         for m in msg.split("\n"):
-            log.error(m)
-            log.newline()
-        log.error("*" * 50)
-        log.newline()
+            LOG.error(m)
+            LOG.newline()
+        LOG.error(BANNER)
+        LOG.newline()
 
         raise RuntimeError(msg)
     # More than 1 package found in this dir.
@@ -506,43 +1230,40 @@ def check_existing_package(package_root, metadata_file):
         msg = "Multiple {0} files found in package root dir.\n{1}\n{2}".format(
             metadata_file, MANUAL_REQ, package_root)
         # Log
-        log.newline()
-        log.error("*" * 50)
-        log.error("Failed Package Overwrite")
-        log.newline()
+        LOG.newline()
+        LOG.error(BANNER)
+        LOG.error("Failed Package Overwrite")
+        LOG.newline()
         for m in msg.split("\n"):
-            log.error(m)
-            log.newline()
-        log.error("Existing packages:")
+            LOG.error(m)
+            LOG.newline()
+        LOG.error("Existing packages:")
         for e in existing:
-            log.error(e)
-        log.newline()
-        log.error("*" * 50)
-        log.newline()
+            LOG.error(e)
+        LOG.newline()
+        LOG.error(BANNER)
+        LOG.newline()
 
         raise RuntimeError(msg)
 
     # Only 1 package found
     # Check package root entry in metadata
-    data = load_json(existing[0])
-    if package_root != os.path.abspath(
-            data.get("package_settings", {}).get("package_root")):
+    found_root = os.path.abspath(_get_metadata_package_root(existing[0]))
+    if package_root != found_root:
         msg = "Found a package, but its root is different than the current " \
             "package root.\n{0}\nInput root: {1}\nFound root: {2}".format(
-                MANUAL_REQ, package_root, os.path.abspath(
-                    data.get("package_settings", {}).get("package_root")
-                )
+                MANUAL_REQ, package_root, found_root
             )
         # Log
-        log.newline()
-        log.error("*" * 50)
-        log.error("Failed Package Overwrite")
-        log.newline()
+        LOG.newline()
+        LOG.error(BANNER)
+        LOG.error("Failed Package Overwrite")
+        LOG.newline()
         for m in msg.split("\n"):
-            log.error(m)
-            log.newline()
-        log.error("*" * 50)
-        log.newline()
+            LOG.error(m)
+            LOG.newline()
+        LOG.error(BANNER)
+        LOG.newline()
 
         raise RuntimeError(msg)
 
@@ -550,7 +1271,7 @@ def check_existing_package(package_root, metadata_file):
 
 
 def remove_existing_package(package_root, metadata_file, tmp_dir=None,
-                            subproc=False):
+                            subproc=None):
     """
     Delete existing package
     Find existing package metadata to confirm dir should be deleted
@@ -562,60 +1283,57 @@ def remove_existing_package(package_root, metadata_file, tmp_dir=None,
                                  Package is moved here and then removed.
                                  Used if there specific project tmp area, etc.
                                  Defaults to tempfile.mkdtemp()
-        subproc (bool, optional): If True, start removal script in its own
-                                  thread, to continue even if program exits.
+        subproc (bool, optional): If True, start removal in its own
+                                  process, to continue even if program exits.
+                                  The package root is renamed before the
+                                  removal starts, so it is gone as soon as
+                                  this function returns.
+                                  Defaults to True on posix, False on Windows.
 
     Returns:
         None
     """
-    log = get_logger(__name__)
-    # TODO - Temporary
-    if "Windows" != platform.system():
-        raise NotImplementedError(
-            "{} platform scene package removal not supported".format(
-                platform.system()))
-
     package_root = clean_path(package_root)
-    # Doesn't exist yet
-    if not os.path.exists(package_root):
-        raise OSError("Package root does not exist: {}".format(package_root))
-
     # Check root is a scene package
-    check_existing_package(package_root, metadata_file)
+    # (Also checks the root exists, no separate exists check needed)
+    if not check_existing_package(package_root, metadata_file):
+        raise OSError("Package root does not exist or is empty: {}".format(
+            package_root))
 
     # Rename existing package to tmp location and delete it
     # Get tmp dir
     rename_dir = "{0}_{1}".format(os.path.basename(package_root.rstrip("/")),
-                                  datetime.now().strftime("%Y-%m-%d_%H%M%S"))
+                                  time.strftime("%Y-%m-%d_%H%M%S"))
     # Remove renamed subdir under tmp_dir
     if tmp_dir:
-        to_remove = os.path.join(os.path.abspath(tmp_dir), rename_dir)
+        to_remove = join_path(clean_path(os.path.abspath(tmp_dir)),
+                              rename_dir)
         tmp_package_root = to_remove
     # Remove full tmp dir
     else:
-        to_remove = tempfile.mkdtemp()
-        tmp_package_root = os.path.join(to_remove, rename_dir)
-    # Clean
-    to_remove = clean_path(to_remove)
-    tmp_package_root = clean_path(tmp_package_root)
+        import tempfile
+        to_remove = clean_path(tempfile.mkdtemp())
+        tmp_package_root = join_path(to_remove, rename_dir)
 
     if os.path.exists(tmp_package_root):
         raise OSError("Cannot rename existing package dir. Destination tmp "
                       "dir already exists: {0}".format(tmp_package_root))
 
     # Rename to tmp
-    log.newline()
-    log.info("Renaming package root: {0} --> {1}".format(package_root,
+    LOG.newline()
+    LOG.info("Renaming package root: {0} --> {1}".format(package_root,
                                                          tmp_package_root))
     make_dirs(os.path.dirname(tmp_package_root))
     os.rename(package_root, tmp_package_root)
 
-    # Remove tmp
-    log.info("Removing package at: {0}".format(tmp_package_root))
+    # Remove tmp (and the mkdtemp dir, if one was made)
+    LOG.info("Removing package at: {0}".format(to_remove))
+    if subproc is None:
+        subproc = "nt" != os.name
     if subproc:
-        spawn_remove_subprocess(tmp_package_root)
+        spawn_remove_subprocess(to_remove)
     else:
-        shutil.rmtree(tmp_package_root)
+        shutil.rmtree(to_remove)
 
 
 def spawn_remove_subprocess(remove_dir):
@@ -625,35 +1343,54 @@ def spawn_remove_subprocess(remove_dir):
     Args:
         remove_dir (str): Dir to remove
     """
-    log = get_logger(__name__)
+    # Only needed for removals, keep out of utils import
+    import platform
+    import subprocess
 
+    # Windows, detach rmdir from this console
     if "Windows" == platform.system():
         kwargs = {
-            "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP
+            "creationflags": (subprocess.CREATE_NEW_PROCESS_GROUP |
+                              getattr(subprocess, "DETACHED_PROCESS", 0x8))
         }
-    # TODO
+        # rmdir needs backslash paths
+        args = ["cmd", "/c", "rmdir", "/s", "/q",
+                os.path.normpath(remove_dir)]
+    # Posix, detach rm into its own session
     else:
-        raise NotImplementedError(
-            "{0} platform scene package removal not supported".format(
-                platform.system()))
-
-    # Create command
-    exe = clean_path(os.path.join(
-        os.getenv("SCENE_PACKAGER_ROOT"), "bin", "remove_scene_package.py"))
-    args = ["python", exe, remove_dir]
+        if hasattr(subprocess, "DEVNULL"):
+            kwargs = {"start_new_session": True}
+        # Python 2
+        else:
+            kwargs = {"preexec_fn": os.setsid}
+        args = ["rm", "-rf", remove_dir]
 
-    log.info("SUBPROC: {}".format(args))
-    log.newline()
+    # Removal errors are not reported back, log where leftovers would be
+    LOG.warning("Removing in the background. If the removal fails, this "
+                "dir is left behind: {0}".format(remove_dir))
+    LOG.warning("SUBPROC: {}".format(args))
+    LOG.newline()
 
     # Run
     try:
-        with open(os.devnull, "w") as out_pipe:
+        if hasattr(subprocess, "DEVNULL"):
+            # Don't leak this process's file handles into the subprocess
             subprocess.Popen(
                 args,
-                stdout=out_pipe,
-                stderr=out_pipe,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
                 **kwargs
             )
+        # Python 2
+        else:
+            with open(os.devnull, "w") as out_pipe:
+                subprocess.Popen(
+                    args,
+                    stdout=out_pipe,
+                    stderr=out_pipe,
+                    **kwargs
+                )
     except Exception:
-        log.error("Failed to start subprocess: {0}".format(" ".join(args)))
+        LOG.error("Failed to start subprocess: {0}".format(" ".join(args)))
         raise